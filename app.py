@@ -1,21 +1,186 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import asyncio
-from scraper import scrape_businesses
+import atexit
+import os
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+import orjson
+from cachetools import TTLCache
+from crawl4ai import AsyncWebCrawler
+from scraper import ScrapeError, scrape_businesses, make_browser_config
+from utils import block_static_assets, safe_name
 from pathlib import Path
 import logging
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; fall back to the stdlib loop
+    uvloop = None
+
 # Configure logging
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()  # e.g. WARNING in production
+# getLevelName maps known names to their number and anything else to a string
+_log_level_valid = isinstance(logging.getLevelName(LOG_LEVEL), int)
 logging.basicConfig(
-    level=logging.INFO,
+    level=LOG_LEVEL if _log_level_valid else logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
+if not _log_level_valid:
+    logger.warning(f"Unknown LOG_LEVEL {LOG_LEVEL!r}; using INFO")
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, which is much faster on large record lists."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)  # Enable CORS for all routes
 
 MAX_RECORDS = 500
+SCRAPE_TIMEOUT = 120  # seconds a /search request waits for the scraper
+CRAWLER_START_TIMEOUT = 60  # seconds to wait for Chromium to launch
+
+# A single event loop and browser are kept alive for the whole process so
+# Chromium is launched once rather than on every search.
+_loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+threading.Thread(target=_loop.run_forever, name='scraper-loop', daemon=True).start()
+_crawler_lock = threading.Lock()
+
+
+async def _start_crawler():
+    crawler = block_static_assets(AsyncWebCrawler(config=make_browser_config()))
+    try:
+        await crawler.start()
+    except BaseException:
+        await crawler.close()
+        raise
+    return crawler
+
+
+def _crawler_is_alive(crawler):
+    """Whether the shared crawler's Chromium is still connected."""
+    browser = getattr(crawler.crawler_strategy.browser_manager, 'browser', None)
+    return browser is not None and browser.is_connected()
+
+
+def _close_crawler(crawler):
+    """Close a crawler on the shared loop, logging rather than raising."""
+    try:
+        asyncio.run_coroutine_threadsafe(crawler.close(), _loop).result(timeout=10)
+    except Exception as e:
+        logger.warning(f"Error closing crawler: {e}")
+
+
+def get_crawler(timeout=CRAWLER_START_TIMEOUT):
+    """
+    Return the shared crawler, launching the browser on first use.
+
+    Crawl4AI does not notice when Chromium crashes or is killed, so a browser
+    that is no longer connected is closed and relaunched here. Raises
+    concurrent.futures.TimeoutError if the crawler isn't ready within
+    ``timeout`` seconds, including time spent waiting on another launch.
+    """
+    deadline = time.monotonic() + timeout
+    if not _crawler_lock.acquire(timeout=timeout):
+        raise FutureTimeoutError(f"Browser not ready after {timeout}s")
+    try:
+        crawler = app.extensions.get('crawler')
+        if crawler is not None and not _crawler_is_alive(crawler):
+            logger.warning("Shared browser is no longer connected; relaunching")
+            del app.extensions['crawler']
+            _close_crawler(crawler)
+            crawler = None
+
+        if crawler is None:
+            future = asyncio.run_coroutine_threadsafe(_start_crawler(), _loop)
+            try:
+                crawler = future.result(timeout=max(deadline - time.monotonic(), 0))
+            except FutureTimeoutError:
+                future.cancel()
+                raise
+            app.extensions['crawler'] = crawler
+    finally:
+        _crawler_lock.release()
+
+    return crawler
+
+
+@atexit.register
+def _shutdown_crawler():
+    """Close the shared browser and stop the background loop."""
+    crawler = app.extensions.pop('crawler', None)
+    if crawler is not None:
+        _close_crawler(crawler)
+    _loop.call_soon_threadsafe(_loop.stop)
+
+
+# Recent search results, keyed by (lower-cased term, max_records). Only
+# touched from the shared loop, so it needs no thread locking.
+SEARCH_CACHE_TTL = 300  # seconds
+_search_cache = TTLCache(maxsize=256, ttl=SEARCH_CACHE_TTL)
+# Per-key [scrape task, number of requests awaiting it]
+_inflight = {}
+
+
+async def _scrape_and_cache(key, search_term, max_records, crawler):
+    results = await scrape_businesses(search_term, max_records, crawler=crawler)
+    # Failures raise ScrapeError, so an empty list is a real "no matches"
+    cached = _search_cache[key] = (results, f"bizfile_{safe_name(search_term)}.csv")
+    return cached
+
+
+async def cached_scrape(search_term, max_records, crawler):
+    """
+    Scrape through the result cache.
+
+    Concurrent identical searches await the same in-flight scrape instead of
+    each driving the browser. Returns the results and the CSV file they were
+    written to; raises ScrapeError if the scrape failed.
+    """
+    key = (search_term.lower(), max_records)
+    if key in _search_cache:
+        logger.info(f"Cache hit for term: '{search_term}' (max: {max_records})")
+        return _search_cache[key]
+
+    entry = _inflight.get(key)
+    if entry is None:
+        task = asyncio.ensure_future(_scrape_and_cache(key, search_term, max_records, crawler))
+        entry = _inflight[key] = [task, 0]
+    entry[1] += 1
+    try:
+        # Shielded so one request timing out doesn't cancel the others' scrape
+        return await asyncio.shield(entry[0])
+    finally:
+        entry[1] -= 1
+        if not entry[1]:
+            del _inflight[key]
+            # Nobody is waiting any more; stop it if it's still running
+            entry[0].cancel()
+
+
+def _stream_search_response(results, summary):
+    """
+    Yield the /search JSON body record by record, so the full response is
+    never built in memory alongside the results.
+    """
+    yield b'{"success":true,"data":['
+    for idx, row in enumerate(results):
+        if idx:
+            yield b','
+        yield orjson.dumps(row)
+    # summary is a non-empty dict, so its JSON starts with '{'
+    yield b'],' + orjson.dumps(summary)[1:]
 
 
 @app.route('/search', methods=['GET'])
@@ -52,16 +217,38 @@ def search():
     logger.info(f"Received search request for term: '{search_term}' (max: {max_records})")
     
     try:
-        # Run the async scraper
-        results = asyncio.run(scrape_businesses(search_term, max_records))
-        
-        # Generate CSV filename
-        safe_name = "".join(c if c.isalnum() else "_" for c in search_term).strip("_") or "results"
-        csv_file = f"bizfile_{safe_name}.csv"
+        # Browser startup and the scrape share one deadline, so a slow launch
+        # can't push the request past SCRAPE_TIMEOUT
+        deadline = time.monotonic() + SCRAPE_TIMEOUT
+        future = None
+        try:
+            crawler = get_crawler(timeout=min(CRAWLER_START_TIMEOUT, SCRAPE_TIMEOUT))
+            # Run the async scraper on the shared loop with the shared browser
+            future = asyncio.run_coroutine_threadsafe(
+                cached_scrape(search_term, max_records, crawler),
+                _loop,
+            )
+            results, csv_file = future.result(timeout=max(deadline - time.monotonic(), 0))
+        except ScrapeError as e:
+            # Already logged by the scraper, along with any partial results
+            return jsonify({
+                'success': False,
+                'error': str(e),
+                'count': len(e.results),
+                'message': 'The search could not be completed. Any partial results were saved to CSV.'
+            }), 502
+        except FutureTimeoutError:
+            # Stop the scrape so it doesn't keep holding the browser
+            if future is not None:
+                future.cancel()
+            logger.warning(f"Search for '{search_term}' timed out after {SCRAPE_TIMEOUT}s")
+            return jsonify({
+                'success': False,
+                'error': f'Scraping timed out after {SCRAPE_TIMEOUT} seconds',
+                'message': 'The search took too long. Try again or lower max_records.'
+            }), 504
         
-        response_data = {
-            'success': True,
-            'data': results,
+        summary = {
             'count': len(results),
             'csv_file': csv_file,
             'search_term': search_term,
@@ -69,9 +256,15 @@ def search():
         }
         
         logger.info(f"Search completed: {len(results)} records returned")
-        return jsonify(response_data), 200
+        return Response(
+            stream_with_context(_stream_search_response(results, summary)),
+            status=200,
+            mimetype='application/json'
+        )
         
     except Exception as e:
+        # Scrape failures are handled above, so anything reaching here
+        # (browser launch, loop submission, cache) is unexpected: keep the traceback
         logger.error(f"Error during scraping: {str(e)}", exc_info=True)
         return jsonify({
             'success': False,
@@ -114,7 +307,7 @@ def index():
 
 
 if __name__ == '__main__':
-    # Development server
+    # Development server only; use `gunicorn -c gunicorn.conf.py app:app` in production
     app.run(
         host='0.0.0.0',
         port=5000,
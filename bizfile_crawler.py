@@ -3,6 +3,9 @@ import csv
 import json
 import sys
 from pathlib import Path
+from string import Template
+
+import orjson
 
 from crawl4ai import (
     AsyncWebCrawler,
@@ -12,6 +15,8 @@ from crawl4ai import (
     JsonCssExtractionStrategy,
 )
 
+from utils import block_static_assets, safe_name
+
 SEARCH_URL = "https://bizfileonline.sos.ca.gov/search/business"
 MAX_RECORDS = 500
 
@@ -24,8 +29,49 @@ SEARCH_INPUT_SELECTOR = ".search-input-wrapper input"
 SEARCH_BUTTON_SELECTOR = ".search-input-wrapper button"
 
 SEARCH_FORM_SELECTOR =".search-input-wrapper form"
+
+# 3) "No results" message shown instead of the table
+NO_RESULTS_SELECTOR = ".no-results, .empty-results"
+
+# 4) Non-essential tags stripped before extraction
+EXCLUDED_TAGS = ["img", "svg", "style", "link", "font"]
 # ===========================================================================
 
+# Resolves once the search has rendered either result rows or a "no results"
+# message, so empty searches don't sit out the whole page timeout
+RESULTS_READY_JS = (
+    f"js:() => !!(document.querySelector('{TABLE_ROW_SELECTOR}')"
+    f" || document.querySelector('{NO_RESULTS_SELECTOR}'))"
+)
+
+# Fills the search box and submits; $term is the JSON-encoded search term
+JS_FILL_AND_SUBMIT = Template(f"""
+(function() {{
+    const input = document.querySelector("{SEARCH_INPUT_SELECTOR}");
+    if (!input) throw new Error("Search input not found: {SEARCH_INPUT_SELECTOR}");
+
+    // Use the native value setter so frameworks (like React) see the change
+    const nativeInputValueSetter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
+    nativeInputValueSetter.call(input, $term);
+
+    // Fire the events the framework is likely listening for
+    input.dispatchEvent(new Event('input', {{ bubbles: true }}));
+    input.dispatchEvent(new Event('change', {{ bubbles: true }}));
+
+    const button = document.querySelector("{SEARCH_BUTTON_SELECTOR}");
+    if (!button) throw new Error("Search button not found: {SEARCH_BUTTON_SELECTOR}");
+
+    // Give any debounce/validation a tick to run, then click
+    setTimeout(() => {{
+        // If they still keep it disabled, we can force-enable as a last resort
+        if (button.disabled) {{
+            button.removeAttribute('disabled');
+        }}
+        button.click();
+    }}, 0);
+}})();
+""")
+
 # CSV column definition – headers should match what the site shows
 CSV_COLUMNS = [
     ("entityInformation", "Entity Information"),
@@ -35,6 +81,8 @@ CSV_COLUMNS = [
     ("formedIn", "Formed In"),
     ("agent", "Agent"),
 ]
+CSV_KEYS = [key for key, _ in CSV_COLUMNS]
+DATE_COLUMNS = {"initialFilingDate"}  # set of keys that hold dates
 
 
 def make_schema():
@@ -89,7 +137,7 @@ def parse_extracted_rows(extracted_content: str):
     if not extracted_content:
         return []
 
-    data = json.loads(extracted_content)
+    data = orjson.loads(extracted_content)
     if isinstance(data, list):
         return data
     if isinstance(data, dict):
@@ -103,70 +151,48 @@ def parse_extracted_rows(extracted_content: str):
 def dedupe_and_cap(rows, max_records):
     """
     Optional: dedupe by entityInformation and cap at max_records.
+
+    Dicts keep insertion order, so the first row seen for each entity wins
+    and page order is preserved without a separate output list.
     """
-    seen = set()
-    cleaned = []
+    seen = {}
 
     for row in rows:
         entity_information = (row.get("entityInformation") or "").strip()
-        if not entity_information:
-            continue
-        if entity_information in seen:
-            continue
-        seen.add(entity_information)
-        cleaned.append(row)
-        if len(cleaned) >= max_records:
-            break
+        if entity_information and entity_information not in seen:
+            seen[entity_information] = row
+            if len(seen) >= max_records:
+                break
 
-    return cleaned
+    return list(seen.values())
 
 
 async def crawl_bizfile(search_term: str, max_records: int = MAX_RECORDS):
     browser_cfg = BrowserConfig(
-        headless=False,
+        headless=True,
         java_script_enabled=True,
-        verbose=True,
+        verbose=False,
+        # Never fetch images; the results table is all we need
+        extra_args=["--blink-settings=imagesEnabled=false"],
     )
 
     schema = make_schema()
     extraction_strategy = JsonCssExtractionStrategy(schema)
 
-    async with AsyncWebCrawler(config=browser_cfg) as crawler:
+    async with block_static_assets(AsyncWebCrawler(config=browser_cfg)) as crawler:
         # ---------- Single page: open, fill search, click button ----------
-        js_fill_and_submit = f"""
-        (function() {{
-            const input = document.querySelector("{SEARCH_INPUT_SELECTOR}");
-            if (!input) throw new Error("Search input not found: {SEARCH_INPUT_SELECTOR}");
-
-            // Use the native value setter so frameworks (like React) see the change
-            const nativeInputValueSetter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
-            nativeInputValueSetter.call(input, {json.dumps(search_term)});
-
-            // Fire the events the framework is likely listening for
-            input.dispatchEvent(new Event('input', {{ bubbles: true }}));
-            input.dispatchEvent(new Event('change', {{ bubbles: true }}));
-
-            const button = document.querySelector("{SEARCH_BUTTON_SELECTOR}");
-            if (!button) throw new Error("Search button not found: {SEARCH_BUTTON_SELECTOR}");
-
-            // Give any debounce/validation a tick to run, then click
-            setTimeout(() => {{
-                // If they still keep it disabled, we can force-enable as a last resort
-                if (button.disabled) {{
-                    button.removeAttribute('disabled');
-                }}
-                button.click();
-            }}, 0);
-        }})();
-        """
-
-
         conf = CrawlerRunConfig(
+            # Crawl4AI caches by URL only, and SEARCH_URL is the same for every
+            # term, so a cached run would replay the first search's results.
+            # Static assets are still served from the browser's own HTTP cache.
             cache_mode=CacheMode.BYPASS,
-            js_code=js_fill_and_submit,
-            # Wait until at least one result row appears
-            wait_for=f"css:{TABLE_ROW_SELECTOR}",
+            js_code=JS_FILL_AND_SUBMIT.substitute(term=json.dumps(search_term)),
+            # Wait until result rows (or the "no results" message) appear
+            wait_for=RESULTS_READY_JS,
             extraction_strategy=extraction_strategy,
+            excluded_tags=EXCLUDED_TAGS,
+            exclude_external_images=True,
+            exclude_external_links=True,
             page_timeout=60000,
         )
 
@@ -179,6 +205,8 @@ async def crawl_bizfile(search_term: str, max_records: int = MAX_RECORDS):
 
         page_rows = parse_extracted_rows(result.extracted_content) or []
         print(f"Got {len(page_rows)} raw rows from page")
+        if not page_rows:
+            return []
 
         final_rows = dedupe_and_cap(page_rows, max_records)
         print(f"Using {len(final_rows)} rows after dedupe/cap")
@@ -186,15 +214,27 @@ async def crawl_bizfile(search_term: str, max_records: int = MAX_RECORDS):
         return final_rows
 
 
+def format_csv_row(row):
+    """Flatten one result row into CSV values, in CSV_COLUMNS order."""
+    formatted_row = []
+    for key, value in zip(CSV_KEYS, map(row.get, CSV_KEYS)):
+        value = (value or "").strip()
+
+        # Excel-friendly date wrapper
+        if key in DATE_COLUMNS and value:
+            value = f'="{value}"'
+
+        formatted_row.append(value)
+
+    return formatted_row
+
+
 def write_csv(rows, search_term: str):
     if not rows:
         print("No rows to write.")
         return
 
-    safe_name = "".join(c if c.isalnum() else "_" for c in search_term).strip("_") or "results"
-    out_path = Path.cwd() / f"bizfile_{safe_name}.csv"
-
-    DATE_COLUMNS = {"initialFilingDate"}  # set of keys that hold dates
+    out_path = Path.cwd() / f"bizfile_{safe_name(search_term)}.csv"
 
     with out_path.open("w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
@@ -202,18 +242,8 @@ def write_csv(rows, search_term: str):
         # Write header row
         writer.writerow([header for _, header in CSV_COLUMNS])
 
-        for row in rows:
-            formatted_row = []
-            for key, _ in CSV_COLUMNS:
-                value = (row.get(key) or "").strip()
-
-                # Excel-friendly date wrapper
-                if key in DATE_COLUMNS and value:
-                    value = f'="{value}"'
-
-                formatted_row.append(value)
-
-            writer.writerow(formatted_row)
+        # writerows drives the loop over the generator in C
+        writer.writerows(format_csv_row(row) for row in rows)
 
     print(f"Wrote {len(rows)} rows to {out_path}")
 
@@ -0,0 +1,22 @@
+"""
+Gunicorn settings for serving the API in production.
+
+Usage: gunicorn -c gunicorn.conf.py app:app
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get("BIND", "0.0.0.0:5000")
+
+# Each worker runs its own event loop and Chromium instance; threads let a
+# worker accept more /search requests while earlier scrapes are in flight.
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 8))
+
+# Scrapes can take well over the 30s default
+timeout = 120
+
+# app.py starts its background loop thread at import time, and threads don't
+# survive fork, so the app must be loaded in each worker rather than preloaded.
+preload_app = False
@@ -6,7 +6,11 @@ import asyncio
 import csv
 import json
 import logging
+import uuid
+from contextlib import nullcontext
 from pathlib import Path
+from string import Template
+from urllib.parse import urljoin
 from typing import List, Dict, Optional
 
 from crawl4ai import (
@@ -14,9 +18,10 @@ from crawl4ai import (
     BrowserConfig,
     CrawlerRunConfig,
     CacheMode,
-    JsonCssExtractionStrategy,
 )
 
+from utils import block_static_assets, safe_name
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -28,92 +33,164 @@ TABLE_ROW_SELECTOR = "table.div-table tbody tr"
 SEARCH_INPUT_SELECTOR = ".search-input-wrapper input"
 SEARCH_BUTTON_SELECTOR = ".search-input-wrapper button"
 SEARCH_FORM_SELECTOR = ".search-input-wrapper form"
+NO_RESULTS_SELECTOR = ".no-results, .empty-results"
+
+# Tags dropped from Crawl4AI's cleaned HTML. This only post-processes the
+# page; stylesheet and font requests are blocked by block_static_assets.
+EXCLUDED_TAGS = ["img", "svg", "style", "link", "font"]
+
+# Fills the search box and submits; $term is the JSON-encoded search term
+JS_FILL_AND_SUBMIT = Template(f"""
+(function() {{
+    const input = document.querySelector("{SEARCH_INPUT_SELECTOR}");
+    if (!input) throw new Error("Search input not found");
+
+    const nativeInputValueSetter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
+    nativeInputValueSetter.call(input, $term);
+
+    input.dispatchEvent(new Event('input', {{ bubbles: true }}));
+    input.dispatchEvent(new Event('change', {{ bubbles: true }}));
+
+    const button = document.querySelector("{SEARCH_BUTTON_SELECTOR}");
+    if (!button) throw new Error("Search button not found");
+
+    setTimeout(() => {{
+        if (button.disabled) {{
+            button.removeAttribute('disabled');
+        }}
+        button.click();
+    }}, 100);
+}})();
+""")
+
+# How long JS_COLLECT_ROWS polls for results; kept under the page timeout
+ROWS_TIMEOUT_MS = 55000
+
+# Runs after JS_FILL_AND_SUBMIT. Waits until the search has rendered either
+# result rows or a "no results" message (so empty searches return at once),
+# then reads every row's cells in one pass and returns them. Crawl4AI hands
+# the return value back in result.js_execution_result.
+JS_COLLECT_ROWS = f"""
+const deadline = Date.now() + {ROWS_TIMEOUT_MS};
+while (!document.querySelector("{TABLE_ROW_SELECTOR}")
+        && !document.querySelector("{NO_RESULTS_SELECTOR}")) {{
+    if (Date.now() > deadline) throw new Error("Timed out waiting for search results");
+    await new Promise(resolve => setTimeout(resolve, 100));
+}}
+
+window.__bizfile_rows = Array.from(document.querySelectorAll("{TABLE_ROW_SELECTOR}")).map(tr => {{
+    const cells = tr.children;
+    // Collapse whitespace so values stay single-line, like the old get_text(strip=True)
+    const text = i => (cells[i] ? cells[i].textContent.replace(/\\s+/g, " ").trim() : "");
+    const link = cells[0] && cells[0].querySelector("a");
+    return {{
+        entityInformation: text(0),
+        initialFilingDate: text(1),
+        status: text(2),
+        entityType: text(3),
+        formedIn: text(4),
+        agent: text(5),
+        detailLink: link ? link.getAttribute("href") : null,
+    }};
+}});
+return window.__bizfile_rows;
+"""
 
+# Detail pages
+DETAIL_CONCURRENCY = 10  # batches (browser tabs) scraped at once
+DETAIL_BATCH_SIZE = 20  # pages scraped in one tab before it is recycled
+
+# Extract data using JavaScript to get all the information. One pass over the
+# label-like elements builds the result; definition lists are covered because a
+# <dt>'s next sibling is its <dd>. Crawl4AI runs js_code as the body of an
+# async function, so the top-level return hands the object back in
+# result.js_execution_result.
+DETAIL_EXTRACT_JS = """
+return (function() {
+    return Array.from(
+        document.querySelectorAll('dt, label, .label, .field-label')
+    ).reduce((acc, label) => {
+        const labelText = label.textContent.trim().replace(':', '');
+        if (!labelText) {
+            return acc;
+        }
+        
+        // Value is the next sibling, or else the rest of the parent's text
+        const sibling = label.nextElementSibling;
+        const value = sibling
+            ? sibling.textContent.trim()
+            : (label.parentElement?.textContent ?? '').trim()
+                .replace(labelText, '').replace(':', '').trim();
+        
+        if (value) {
+            acc[labelText] = value;
+        }
+        return acc;
+    }, {});
+})();
+"""
 
-def make_search_schema():
-    """Schema for extracting search results table."""
-    return {
-        "name": "BizfileSearchResults",
-        "baseSelector": TABLE_ROW_SELECTOR,
-        "fields": [
-            {
-                "name": "entityInformation",
-                "selector": "td:nth-child(1)",
-                "type": "text",
-            },
-            {
-                "name": "initialFilingDate",
-                "selector": "td:nth-child(2)",
-                "type": "text",
-            },
-            {
-                "name": "status",
-                "selector": "td:nth-child(3)",
-                "type": "text",
-            },
-            {
-                "name": "entityType",
-                "selector": "td:nth-child(4)",
-                "type": "text",
-            },
-            {
-                "name": "formedIn",
-                "selector": "td:nth-child(5)",
-                "type": "text",
-            },
-            {
-                "name": "agent",
-                "selector": "td:nth-child(6)",
-                "type": "text",
-            },
-            {
-                "name": "detailLink",
-                "selector": "td:nth-child(1) a",
-                "type": "attribute",
-                "attribute": "href",
-            },
-        ],
-    }
-
-
-def parse_extracted_rows(extracted_content: str) -> List[Dict]:
-    """Parse JSON from JsonCssExtractionStrategy."""
-    if not extracted_content:
-        return []
+# CSV column definition – keys of the search result rows, in output order
+CSV_COLUMNS = [
+    ("entityInformation", "Entity Information"),
+    ("initialFilingDate", "Initial Filing Date"),
+    ("status", "Status"),
+    ("entityType", "Entity Type"),
+    ("formedIn", "Formed In"),
+    ("agent", "Agent"),
+]
+CSV_FIELDNAMES = [key for key, _ in CSV_COLUMNS]
+DATE_COLUMNS = {"initialFilingDate"}  # set of keys that hold dates
 
-    try:
-        data = json.loads(extracted_content)
-        if isinstance(data, list):
-            return data
-        if isinstance(data, dict):
-            for key in ("items", "rows", "BizfileSearchResults"):
-                if key in data and isinstance(data[key], list):
-                    return data[key]
-        return []
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse extracted content: {e}")
-        return []
+
+class ScrapeError(Exception):
+    """
+    The search itself failed, as opposed to finding no matches.
+
+    ``results`` holds any records scraped before the failure; they have
+    already been written to the CSV file.
+    """
+
+    def __init__(self, message: str, results: Optional[List[Dict]] = None):
+        super().__init__(message)
+        self.results = results or []
+
+
+def parse_collected_rows(js_execution_result: Optional[Dict]) -> List[Dict]:
+    """
+    Pull the rows returned by JS_COLLECT_ROWS out of Crawl4AI's
+    js_execution_result, which holds one entry per js_code script.
+
+    Raises ScrapeError if the script failed or returned nothing usable, so a
+    broken search isn't mistaken for one with no matches.
+    """
+    results = (js_execution_result or {}).get("results") or []
+    rows = results[-1] if results else None
+
+    if isinstance(rows, list):
+        return rows
+    if isinstance(rows, dict) and rows.get("error"):
+        raise ScrapeError(f"Failed to collect search rows: {rows['error']}")
+    raise ScrapeError("Failed to collect search rows: no result from the page script")
 
 
 def dedupe_and_cap(rows, max_records):
     """
     Optional: dedupe by entityInformation and cap at max_records.
+
+    Dicts keep insertion order, so the first row seen for each entity wins
+    and page order is preserved without a separate output list.
     """
-    seen = set()
-    cleaned = []
+    seen = {}
 
     for row in rows:
         entity_information = (row.get("entityInformation") or "").strip()
-        if not entity_information:
-            continue
-        if entity_information in seen:
-            continue
-        seen.add(entity_information)
-        cleaned.append(row)
-        if len(cleaned) >= max_records:
-            break
+        if entity_information and entity_information not in seen:
+            seen[entity_information] = row
+            if len(seen) >= max_records:
+                break
 
-    return cleaned
+    return list(seen.values())
 
 
 async def scrape_detail_page(crawler: AsyncWebCrawler, detail_url: str) -> Dict:
@@ -127,174 +204,256 @@ async def scrape_detail_page(crawler: AsyncWebCrawler, detail_url: str) -> Dict:
     Returns:
         Dictionary with all detail page fields
     """
-    detail_data = {}
-    
     try:
-        logger.info(f"Scraping detail page: {detail_url}")
-        
-        # Create extraction strategy for detail page
-        # We'll use a generic approach to extract all visible data
-        conf = CrawlerRunConfig(
-            cache_mode=CacheMode.BYPASS,
-            page_timeout=30000,
-            wait_for="css:body",  # Wait for page to load
-        )
-        
-        result = await crawler.arun(url=detail_url, config=conf)
-        
-        if not result.success:
-            logger.warning(f"Failed to load detail page {detail_url}: {result.error_message}")
-            return detail_data
-        
-        # Extract data using JavaScript to get all the information
-        js_extract = """
-        (function() {
-            const data = {};
-            
-            // Try to extract all label-value pairs
-            const labels = document.querySelectorAll('label, .label, .field-label, dt');
-            labels.forEach(label => {
-                const labelText = label.textContent.trim().replace(':', '');
-                let value = '';
-                
-                // Try to find the associated value
-                if (label.nextElementSibling) {
-                    value = label.nextElementSibling.textContent.trim();
-                } else if (label.parentElement) {
-                    const parent = label.parentElement;
-                    const allText = parent.textContent.trim();
-                    value = allText.replace(labelText, '').replace(':', '').trim();
-                }
-                
-                if (labelText && value) {
-                    data[labelText] = value;
-                }
-            });
-            
-            // Also try dd elements (definition lists)
-            const dds = document.querySelectorAll('dd');
-            const dts = document.querySelectorAll('dt');
-            dts.forEach((dt, index) => {
-                if (dds[index]) {
-                    data[dt.textContent.trim()] = dds[index].textContent.trim();
-                }
-            });
-            
-            return JSON.stringify(data);
-        })();
-        """
-        
-        # Run the extraction
-        extract_conf = CrawlerRunConfig(
-            cache_mode=CacheMode.BYPASS,
-            js_code=js_extract,
-            page_timeout=10000,
-        )
-        
-        extract_result = await crawler.arun(url=detail_url, config=extract_conf)
-        
-        if extract_result.success and extract_result.extracted_content:
-            try:
-                detail_data = json.loads(extract_result.extracted_content)
-            except json.JSONDecodeError:
-                logger.warning(f"Could not parse detail page data for {detail_url}")
-        
-        # Add the detail URL for reference
-        detail_data['detail_url'] = detail_url
+        logger.debug("Scraping detail page: %s", detail_url)
+        result = await crawler.arun(url=detail_url, config=make_detail_config())
+        return parse_detail_result(result, detail_url)
         
     except Exception as e:
         logger.error(f"Error scraping detail page {detail_url}: {e}", exc_info=True)
+        return {}
+
+
+async def scrape_detail_pages(
+    crawler: AsyncWebCrawler,
+    detail_urls: List[str],
+    concurrency: int = DETAIL_CONCURRENCY,
+) -> Dict[str, Dict]:
+    """
+    Scrape many detail pages, in DETAIL_BATCH_SIZE batches run concurrently.
+    
+    Args:
+        crawler: The AsyncWebCrawler instance
+        detail_urls: Full URLs of the detail pages
+        concurrency: Maximum number of batches (browser tabs) in flight
+    
+    Returns:
+        Mapping of detail URL to its fields (empty dict if the page failed)
+    """
+    if not detail_urls:
+        return {}
+
+    logger.info(f"Scraping {len(detail_urls)} detail pages ({concurrency} at a time)")
+
+    batches = [
+        detail_urls[start:start + DETAIL_BATCH_SIZE]
+        for start in range(0, len(detail_urls), DETAIL_BATCH_SIZE)
+    ]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_batch(batch: List[str]) -> Dict[str, Dict]:
+        async with semaphore:
+            return await scrape_detail_batch(crawler, batch)
+
+    details = {}
+    for batch_details in await asyncio.gather(*(run_batch(batch) for batch in batches)):
+        details.update(batch_details)
+
+    return details
+
+
+async def scrape_detail_batch(crawler: AsyncWebCrawler, detail_urls: List[str]) -> Dict[str, Dict]:
+    """
+    Scrape detail pages one after another in a single browser tab.
     
+    The batch shares one Crawl4AI session, so the tab and its JS engine are
+    reused from page to page. The tab is closed when the batch ends, which
+    keeps memory bounded.
+    
+    Args:
+        crawler: The AsyncWebCrawler instance
+        detail_urls: Full URLs of the detail pages in this batch
+    
+    Returns:
+        Mapping of detail URL to its fields (empty dict if the page failed)
+    """
+    session_id = f"detail-{uuid.uuid4().hex}"
+    conf = make_detail_config().clone(session_id=session_id)
+    details = {}
+
+    try:
+        for detail_url in detail_urls:
+            try:
+                logger.debug("Scraping detail page: %s", detail_url)
+                result = await crawler.arun(url=detail_url, config=conf)
+                details[detail_url] = parse_detail_result(result, detail_url)
+            except Exception as e:
+                logger.error(f"Error scraping detail page {detail_url}: {e}", exc_info=True)
+                details[detail_url] = {}
+    finally:
+        await close_session_page(crawler, session_id)
+
+    return details
+
+
+async def close_session_page(crawler: AsyncWebCrawler, session_id: str):
+    """
+    Close the tab behind a Crawl4AI session.
+    
+    crawler.crawler_strategy.kill_session is not used here: it also closes the
+    session's browser context, and that context is shared with every other page
+    opened with the same run config, including concurrent searches.
+    """
+    sessions = crawler.crawler_strategy.browser_manager.sessions
+    session = sessions.pop(session_id, None)
+    if session is None:
+        return
+
+    _, page, _ = session
+    try:
+        await page.close()
+    except Exception as e:
+        logger.warning(f"Error closing detail session {session_id}: {e}")
+
+
+def make_detail_config() -> CrawlerRunConfig:
+    """Load a detail page and run the field extraction in one navigation."""
+    return CrawlerRunConfig(
+        cache_mode=CacheMode.BYPASS,
+        js_code=DETAIL_EXTRACT_JS,
+        wait_for="css:body",  # Wait for page to load
+        page_timeout=30000,
+    )
+
+
+def parse_detail_result(result, detail_url: str) -> Dict:
+    """Turn a detail page crawl result into a dictionary of its fields."""
+    detail_data = {}
+
+    if not result.success:
+        logger.warning(f"Failed to load detail page {detail_url}: {result.error_message}")
+        return detail_data
+
+    # js_execution_result holds one entry per js_code script
+    results = (result.js_execution_result or {}).get("results") or []
+    fields = results[0] if results else None
+
+    if isinstance(fields, dict) and fields.get("success") is False and "error" in fields:
+        logger.warning(f"Could not extract detail page data for {detail_url}: {fields['error']}")
+    elif isinstance(fields, dict):
+        detail_data = dict(fields)
+    else:
+        logger.warning(f"Could not extract detail page data for {detail_url}")
+
+    # Add the detail URL for reference
+    detail_data['detail_url'] = detail_url
+
     return detail_data
 
 
-async def scrape_businesses(search_term: str, max_records: int = MAX_RECORDS) -> List[Dict]:
+def make_browser_config() -> BrowserConfig:
+    """Browser settings shared by one-off and long-lived crawlers."""
+    return BrowserConfig(
+        headless=True,
+        java_script_enabled=True,
+        verbose=False,
+        # Never fetch images; the results table is all we need
+        extra_args=["--blink-settings=imagesEnabled=false"],
+    )
+
+
+async def scrape_businesses(
+    search_term: str,
+    max_records: int = MAX_RECORDS,
+    crawler: Optional[AsyncWebCrawler] = None,
+    include_details: bool = False,
+) -> List[Dict]:
     """
     Main scraping function that searches for businesses and scrapes detail pages.
     
     Args:
         search_term: The search term to query
         max_records: Maximum number of records to scrape
+        crawler: An already started crawler to reuse. If omitted, a browser
+            is launched for this search and closed afterwards.
+        include_details: Also scrape each record's detail page
     
     Returns:
-        List of dictionaries containing all scraped data
-    """
-    browser_cfg = BrowserConfig(
-        headless=False,  # Set to True for production
-        java_script_enabled=True,
-        verbose=True,
-    )
+        List of dictionaries containing all scraped data; empty if the search
+        had no matches
 
+    Raises:
+        ScrapeError: The search could not be completed. Records scraped before
+            the failure are on the exception and in the CSV file.
+    """
     all_results = []
     errors = []
+    csv_out = CsvResultWriter(search_term)
+
+    if crawler is None:
+        crawler_ctx = block_static_assets(AsyncWebCrawler(config=make_browser_config()))
+    else:
+        # Caller owns the crawler's lifecycle; don't close it on exit
+        crawler_ctx = nullcontext(crawler)
 
     try:
-        async with AsyncWebCrawler(config=browser_cfg) as crawler:
+        async with crawler_ctx as crawler:
             # Step 1: Perform search and get search results
             logger.info(f"Searching for: {search_term}")
-            
-            js_fill_and_submit = f"""
-            (function() {{
-                const input = document.querySelector("{SEARCH_INPUT_SELECTOR}");
-                if (!input) throw new Error("Search input not found");
-
-                const nativeInputValueSetter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
-                nativeInputValueSetter.call(input, {json.dumps(search_term)});
-
-                input.dispatchEvent(new Event('input', {{ bubbles: true }}));
-                input.dispatchEvent(new Event('change', {{ bubbles: true }}));
-
-                const button = document.querySelector("{SEARCH_BUTTON_SELECTOR}");
-                if (!button) throw new Error("Search button not found");
-
-                setTimeout(() => {{
-                    if (button.disabled) {{
-                        button.removeAttribute('disabled');
-                    }}
-                    button.click();
-                }}, 100);
-            }})();
-            """
-
-            schema = make_search_schema()
-            extraction_strategy = JsonCssExtractionStrategy(schema)
 
             conf = CrawlerRunConfig(
+                # Crawl4AI caches by URL only, and SEARCH_URL is the same for every
+                # term, so a cached run would replay the first search's results.
+                # Static assets are still served from the browser's own HTTP cache.
                 cache_mode=CacheMode.BYPASS,
-                js_code=js_fill_and_submit,
-                wait_for=f"css:{TABLE_ROW_SELECTOR}",
-                extraction_strategy=extraction_strategy,
+                # Rows are read in-page by JS_COLLECT_ROWS, which also does the
+                # waiting, so no extraction strategy or wait_for is needed
+                js_code=[
+                    JS_FILL_AND_SUBMIT.substitute(term=json.dumps(search_term)),
+                    JS_COLLECT_ROWS,
+                ],
+                excluded_tags=EXCLUDED_TAGS,
+                exclude_external_images=True,
+                exclude_external_links=True,
                 page_timeout=60000,
             )
 
             result = await crawler.arun(url=SEARCH_URL, config=conf)
             
             if not result.success:
-                error_msg = f"Search failed: {result.error_message}"
-                logger.error(error_msg)
-                errors.append(error_msg)
-                # Save whatever we have and return
-                write_csv(all_results, search_term, errors)
-                return all_results
+                raise ScrapeError(f"Search failed: {result.error_message}")
 
             # Parse search results
-            search_rows = parse_extracted_rows(result.extracted_content) or []
+            search_rows = parse_collected_rows(result.js_execution_result)
             logger.info(f"Found {len(search_rows)} search results")
+            if not search_rows:
+                return all_results
 
             # Dedupe and cap the results
             final_rows = dedupe_and_cap(search_rows, max_records)
             logger.info(f"Using {len(final_rows)} rows after dedupe/cap")
 
-            # Step 2: Process search results (detail page scraping removed for speed)
+            # Step 2: Optionally scrape detail pages, all in parallel (off by default for speed)
+            details = {}
+            if include_details:
+                detail_urls = [
+                    urljoin(SEARCH_URL, row["detailLink"])
+                    for row in final_rows
+                    if row.get("detailLink")
+                ]
+                try:
+                    details = await scrape_detail_pages(crawler, detail_urls)
+                except Exception as e:
+                    error_msg = f"Error scraping detail pages: {e}"
+                    logger.error(error_msg, exc_info=True)
+                    errors.append(error_msg)
+
+            # Step 3: Process search results
             for idx, row in enumerate(final_rows):
                 try:
-                    # Just use search result data
                     combined_data = {
                         "search_result": row,
                     }
+                    if include_details:
+                        detail_link = row.get("detailLink")
+                        combined_data["detail_page"] = (
+                            details.get(urljoin(SEARCH_URL, detail_link), {}) if detail_link else {}
+                        )
                     
                     all_results.append(combined_data)
-                    logger.info(f"Processed {idx + 1}/{len(final_rows)}")
+                    csv_out.write(combined_data)
+                    # Per-record progress is debug-only, formatted lazily
+                    logger.debug("Processed %d/%d", idx + 1, len(final_rows))
                     
                 except Exception as e:
                     error_msg = f"Error processing record {idx + 1}: {e}"
@@ -303,85 +462,109 @@ async def scrape_businesses(search_term: str, max_records: int = MAX_RECORDS) ->
                     # Continue with next record
                     continue
 
+    except ScrapeError as e:
+        logger.error(str(e))
+        errors.append(str(e))
+        raise
+
     except Exception as e:
         error_msg = f"Fatal error during scraping: {e}"
         logger.error(error_msg, exc_info=True)
         errors.append(error_msg)
+        raise ScrapeError(error_msg, all_results) from e
     
     finally:
         # Always save results, even if incomplete
-        write_csv(all_results, search_term, errors)
+        csv_out.close()
+        if csv_out.open_failed:
+            errors.append(f"Could not write CSV file {csv_out.out_path}")
+        write_errors(errors, search_term)
     
     return all_results
 
 
-def write_csv(results: List[Dict], search_term: str, errors: List[str] = None):
+def format_csv_row(row: Dict) -> List[str]:
+    """
+    Flatten a search result row into CSV values, in CSV_COLUMNS order.
+    Missing keys become empty strings and dates get an Excel-friendly wrapper.
+    """
+    formatted_row = []
+    for key, value in zip(CSV_FIELDNAMES, map(row.get, CSV_FIELDNAMES)):
+        value = (value or '').strip()
+
+        # Excel-friendly date wrapper
+        if key in DATE_COLUMNS and value:
+            value = f'="{value}"'
+
+        formatted_row.append(value)
+
+    return formatted_row
+
+
+class CsvResultWriter:
+    """
+    Stream scraped results to CSV one row at a time.
+
+    The file is opened on the first row, so a search that finds nothing
+    does not leave an empty CSV behind. If it can't be opened, the failure
+    is logged once and later rows are dropped.
+    """
+
+    def __init__(self, search_term: str):
+        self.out_path = Path.cwd() / f"bizfile_{safe_name(search_term)}.csv"
+        self.rows_written = 0
+        self.open_failed = False
+        self._file = None
+        self._writer = None
+
+    def write(self, result: Dict):
+        """Flatten one result and append it to the CSV."""
+        if self.open_failed:
+            return
+        if self._writer is None:
+            try:
+                self._file = self.out_path.open("w", newline="", encoding="utf-8")
+            except OSError:
+                self.open_failed = True
+                logger.error(f"Could not open {self.out_path} for writing", exc_info=True)
+                return
+            self._writer = csv.writer(self._file)
+            self._writer.writerow([label for _, label in CSV_COLUMNS])
+
+        # Only search result fields go to the CSV (detailLink is internal)
+        self._writer.writerow(format_csv_row(result.get('search_result', {})))
+        self.rows_written += 1
+
+    def close(self):
+        """Close the CSV file, if any rows were written."""
+        if self.open_failed:
+            return
+        if self._file is None:
+            logger.warning("No results to write to CSV")
+            return
+
+        self._file.close()
+        logger.info(f"Wrote {self.rows_written} rows to {self.out_path}")
+
+
+def write_errors(errors: List[str], search_term: str):
     """
-    Write scraped results to CSV file.
+    Write error messages encountered during scraping to a text file.
     
     Args:
-        results: List of result dictionaries
-        search_term: The search term used
         errors: List of error messages encountered
+        search_term: The search term used
     """
-    if not results:
-        logger.warning("No results to write to CSV")
+    if not errors:
         return
 
-    safe_name = "".join(c if c.isalnum() else "_" for c in search_term).strip("_") or "results"
-    out_path = Path.cwd() / f"bizfile_{safe_name}.csv"
-
-    DATE_COLUMNS = {"initialFilingDate"}  # set of keys that hold dates
+    error_path = Path.cwd() / f"bizfile_{safe_name(search_term)}_errors.txt"
 
     try:
-        # Collect all unique keys from all results
-        all_keys = set()
-        
-        # Flatten the nested structure for CSV
-        flattened_results = []
-        for result in results:
-            flat = {}
-            
-            # Add search result fields
-            search_data = result.get('search_result', {})
-            for key, value in search_data.items():
-                if key != 'detailLink':  # Skip internal link
-                    flat[key] = value
-            
-            all_keys.update(flat.keys())
-            flattened_results.append(flat)
-        
-        # Sort keys for consistent column order
-        sorted_keys = sorted(all_keys)
-        
-        with out_path.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=sorted_keys)
-            writer.writeheader()
-            
-            for row in flattened_results:
-                # Fill in missing keys with empty strings and apply date formatting
-                complete_row = {}
-                for key in sorted_keys:
-                    value = row.get(key, '').strip() if row.get(key) else ''
-                    
-                    # Excel-friendly date wrapper
-                    if key in DATE_COLUMNS and value:
-                        value = f'="{value}"'
-                    
-                    complete_row[key] = value
-                
-                writer.writerow(complete_row)
-        
-        logger.info(f"Wrote {len(results)} rows to {out_path}")
-        
-        # Write errors to a separate file if any
-        if errors:
-            error_path = Path.cwd() / f"bizfile_{safe_name}_errors.txt"
-            with error_path.open("w", encoding="utf-8") as f:
-                f.write(f"Errors encountered during scraping:\n\n")
-                for error in errors:
-                    f.write(f"- {error}\n")
-            logger.info(f"Wrote {len(errors)} errors to {error_path}")
-            
+        with error_path.open("w", encoding="utf-8") as f:
+            f.write(f"Errors encountered during scraping:\n\n")
+            for error in errors:
+                f.write(f"- {error}\n")
+        logger.info(f"Wrote {len(errors)} errors to {error_path}")
     except Exception as e:
-        logger.error(f"Error writing CSV: {e}", exc_info=True)
+        logger.error(f"Error writing error log: {e}", exc_info=True)
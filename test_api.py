@@ -3,7 +3,7 @@
 Simple test client for the Business Scraper API
 Usage: python test_api.py [search_term]
 """
-import requests
+import httpx
 import sys
 import json
 
@@ -16,13 +16,25 @@ def test_api(search_term: str = "ACME", max_records: int = 10):
     print(f"Testing Business Scraper API")
     print(f"{'='*60}\n")
     
+    # One keep-alive client, so every call after the first reuses the socket.
+    # No timeout: the search endpoint can take a while to scrape.
+    with httpx.Client(
+        base_url=base_url,
+        limits=httpx.Limits(max_keepalive_connections=5),
+        timeout=None,
+    ) as client:
+        run_checks(client, search_term, max_records)
+
+
+def run_checks(client: httpx.Client, search_term: str, max_records: int):
+    """Run each endpoint check against the API using a shared client."""
     # Test 1: Health check
     print("1. Testing health endpoint...")
     try:
-        response = requests.get(f"{base_url}/health")
+        response = client.get("/health")
         print(f"   Status: {response.status_code}")
         print(f"   Response: {response.json()}\n")
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print("   ERROR: Could not connect to API. Is the server running?")
         print("   Start the server with: python app.py\n")
         return
@@ -33,7 +45,7 @@ def test_api(search_term: str = "ACME", max_records: int = 10):
     # Test 2: Root endpoint (documentation)
     print("2. Testing documentation endpoint...")
     try:
-        response = requests.get(f"{base_url}/")
+        response = client.get("/")
         print(f"   Status: {response.status_code}")
         data = response.json()
         print(f"   Available endpoints: {list(data.get('endpoints', {}).keys())}\n")
@@ -45,8 +57,8 @@ def test_api(search_term: str = "ACME", max_records: int = 10):
     print(f"   (This may take a while as it scrapes the website)\n")
     
     try:
-        response = requests.get(
-            f"{base_url}/search",
+        response = client.get(
+            "/search",
             params={"term": search_term, "max_records": max_records}
         )
         
@@ -90,7 +102,7 @@ def test_api(search_term: str = "ACME", max_records: int = 10):
     # Test 4: Invalid request (missing term)
     print("4. Testing error handling (missing required parameter)...")
     try:
-        response = requests.get(f"{base_url}/search")
+        response = client.get("/search")
         print(f"   Status: {response.status_code}")
         print(f"   Response: {response.json()}\n")
     except Exception as e:
@@ -0,0 +1,41 @@
+"""
+Helpers shared by the API server and the scrapers.
+"""
+import re
+import weakref
+
+_SAFE_RE = re.compile(r"[\W_]+")  # anything but Unicode letters and digits
+
+# Stylesheets and web fonts; the scrapers read the DOM, never the layout
+BLOCKED_ASSETS = "**/*.{css,woff,woff2,ttf,otf}"
+_routed_contexts = weakref.WeakSet()
+
+
+def safe_name(search_term: str) -> str:
+    """Turn a search term into a filename-safe stem, e.g. for bizfile_<stem>.csv."""
+    return _SAFE_RE.sub("_", search_term).strip("_") or "results"
+
+
+async def _abort_route(route):
+    await route.abort()
+
+
+async def _block_assets_hook(page, context=None, **kwargs):
+    # Runs on every arun, including reused session pages, so each browser
+    # context is only routed once
+    context = context or page.context
+    if context not in _routed_contexts:
+        _routed_contexts.add(context)
+        await context.route(BLOCKED_ASSETS, _abort_route)
+    return page
+
+
+def block_static_assets(crawler):
+    """
+    Abort stylesheet and font requests in every page the crawler opens.
+
+    Crawl4AI's excluded_tags only cleans the HTML after the page has loaded,
+    so the requests have to be stopped in the browser instead.
+    """
+    crawler.crawler_strategy.set_hook("on_page_context_created", _block_assets_hook)
+    return crawler